@@ -1,6 +1,6 @@
 """Implementation of the notion of complex number
 
->>> from complex import Complex, i
+>>> from complex import Complex, i, cexp
 >>> print(i)
 0.0 + 1.0i
 >>> znumber = Complex(3, 4)
@@ -9,42 +9,127 @@
 >>> znumber_fromstring_exp = Complex(from_string="5e^3.1415926i")
 >>> znumber + znumber_fromstring
 >>> z_conj = znumber.conjugate
+>>> z_exp = cexp(2 * i)
 """
 
+import functools
+import importlib
 import math
 from typing import Union, SupportsFloat
+
+import numpy as np
+
 from .complex import Complex
 
-from . import _version
-__version__ = _version.get_versions()['version']
+try:
+    from ._ccomplex import CComplex
+except ImportError:
+    CComplex = None
+    """Compiled complex number type, see `complex._ccomplex`. None if the extension was not compiled."""
+
+
+_LAZY_ATTRIBUTES = {
+    "ComplexArray": "array",
+    "cexp_array": "_fast",
+    "clog_array": "_fast",
+    "polar_array": "_fast",
+    "cartesian_array": "_fast",
+}
+"""Attributes imported from their submodule on first access, so that scalar users do not pay for importing
+`complex._fast`, and Numba with it"""
+
+
+def __getattr__(name):
+    """Computes `__version__` on first access only, since versioneer may have to call git to find it. Also imports
+    the array functions and `complex.array.ComplexArray` on first access."""
+    if name == "__version__":
+        from . import _version
+
+        version = _version.get_versions()["version"]
+        globals()["__version__"] = version
+        return version
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 i = Complex(0, 1)
 """The pure imaginary number"""
+I = i
+"""Alias of `complex.i`"""
+ZERO = Complex(0, 0)
+"""Zero, neutral element of the addition"""
+ONE = Complex(1, 0)
+"""One, neutral element of the multiplication"""
 
 mathexp = math.exp
 
 
-def myexp(number) -> Union[float, Complex]:
-    """Overloads `math.exp` to accept complex numbers"""
-    if isinstance(number, Complex):
-        return mathexp(number.real) * Complex(norm=1, theta=number.imaginary)
-    return mathexp(number)
+def _to_complex128(real: np.ndarray, imaginary: np.ndarray) -> np.ndarray:
+    values = np.empty(real.shape, dtype=np.complex128)
+    values.real = real
+    values.imag = imaginary
+    return values
 
 
-math.exp = myexp
+# _Complex and _mathexp are bound as default arguments so that they are local variables in the function
+def cexp(
+    number: Union[SupportsFloat, Complex, np.ndarray], _Complex=Complex, _mathexp=mathexp
+) -> Union[float, Complex, np.ndarray]:
+    """Same as `math.exp`, but also accepts complex numbers. Subclasses of `complex.Complex` are not supported.
+
+    NumPy arrays are accepted too: real arrays go through `numpy.exp` and complex arrays through
+    `complex._fast.cexp_array`.
+    """
+    if type(number) is _Complex:
+        # The result is kept in polar form: cos and sin are only computed if its real or imaginary part is read
+        return _Complex._from_polar(_mathexp(number.real), number.imaginary)
+    if isinstance(number, np.ndarray):
+        if number.dtype.kind == "c":
+            from ._fast import cexp_array  # pylint: disable=import-outside-toplevel
+
+            return _to_complex128(*cexp_array(number.real, number.imag))
+        return np.exp(number)
+    return _mathexp(number)
+
 
 mathlog = math.log
 
 
-def mylog(number: Union[SupportsFloat, Complex], base=None) -> Union[float, Complex]:
-    """Overloads `math.log` to accept complex numbers"""
-    if isinstance(number, Complex):
-        if base is None:
-            return mathlog(number.norm) + i * number.theta
-        return mathlog(number.norm, base) + i * number.theta / mathlog(base)
-    print(number)
-    if base is None:
-        return mathlog(number)
-    return mathlog(number, base)
+@functools.lru_cache(maxsize=128)
+def _inv_log(base) -> float:
+    """Inverse of the logarithm of a base given to `complex.clog`. Cached, and bounded so that sweeping over many
+    bases does not grow the cache forever."""
+    return 1.0 / mathlog(base)
 
 
-math.log = mylog
+# _Complex and _mathlog are bound as default arguments so that they are local variables in the function
+def clog(
+    number: Union[SupportsFloat, Complex, np.ndarray], base=None, _Complex=Complex, _mathlog=mathlog
+) -> Union[float, Complex, np.ndarray]:
+    """Same as `math.log`, but also accepts complex numbers. Subclasses of `complex.Complex` are not supported.
+
+    NumPy arrays are accepted too: real arrays go through `numpy.log` and complex arrays through
+    `complex._fast.clog_array`.
+    """
+    if type(number) is _Complex:
+        if base is None:
+            return _Complex._from_cartesian(_mathlog(number.norm), number.theta)
+        inv = _inv_log(base)
+        return _Complex._from_cartesian(_mathlog(number.norm) * inv, number.theta * inv)
+    if isinstance(number, np.ndarray):
+        if number.dtype.kind != "c":
+            return np.log(number) if base is None else np.log(number) * _inv_log(base)
+        from ._fast import clog_array  # pylint: disable=import-outside-toplevel
+
+        real, imaginary = clog_array(number.real, number.imag)
+        if base is not None:
+            inv = _inv_log(base)
+            real, imaginary = real * inv, imaginary * inv
+        return _to_complex128(real, imaginary)
+    if base is None:
+        return _mathlog(number)
+    return _mathlog(number, base)
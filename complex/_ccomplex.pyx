@@ -0,0 +1,159 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled complex number type, for arithmetic-heavy loops
+
+`CComplex` stores its real and imaginary parts as C doubles and only implements arithmetic, exponential and
+logarithm. It is only available if the extension was compiled when installing the package, see `complex.CComplex`.
+Use `complex.Complex` for everything else (string parsing, representations, plotting...).
+"""
+
+from libc.math cimport atan2, cos, exp, hypot, log, sin
+
+
+cdef class CComplex:
+    """Complex number with C double real and imaginary parts
+
+    Attributes
+    ----------
+    real: float
+    imaginary: float
+    """
+
+    cdef public double real
+    cdef public double imaginary
+
+    def __init__(self, double real=0.0, double imaginary=0.0):
+        """
+        Parameters
+        ----------
+        real: float
+        imaginary: float
+
+        Examples
+        --------
+        >>> print(CComplex(3, 4) * CComplex(1, 2))
+        -5.0 + 10.0i
+        """
+        self.real = real
+        self.imaginary = imaginary
+
+    @property
+    def norm(self) -> float:
+        """Norm"""
+        return hypot(self.real, self.imaginary)
+
+    @property
+    def theta(self) -> float:
+        """Argument, in ]-pi, pi]"""
+        return atan2(self.imaginary, self.real)
+
+    @property
+    def conjugate(self) -> "CComplex":
+        """Complex conjugate"""
+        return _new(self.real, -self.imaginary)
+
+    def exp(self) -> "CComplex":
+        """Exponential"""
+        cdef double norm = exp(self.real)
+        return _new(norm * cos(self.imaginary), norm * sin(self.imaginary))
+
+    def log(self) -> "CComplex":
+        """Natural logarithm"""
+        return _new(log(hypot(self.real, self.imaginary)), atan2(self.imaginary, self.real))
+
+    def __str__(self) -> str:
+        bsign = "+" if self.imaginary > 0 else "-"
+        return f"{self.real} {bsign} {abs(self.imaginary)}i"
+
+    def __repr__(self) -> str:
+        return f"CComplex({self.real!r}, {self.imaginary!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CComplex):
+            return self.real == (<CComplex>other).real and self.imaginary == (<CComplex>other).imaginary
+        if isinstance(other, (int, float)):
+            return self.imaginary == 0 and self.real == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.real, self.imaginary))
+
+    def __neg__(self) -> "CComplex":
+        return _new(-self.real, -self.imaginary)
+
+    def __pos__(self) -> "CComplex":
+        return self
+
+    def __abs__(self) -> float:
+        return hypot(self.real, self.imaginary)
+
+    def __add__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _new(self.real + a, self.imaginary + b)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _new(self.real - a, self.imaginary - b)
+
+    def __rsub__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _new(a - self.real, b - self.imaginary)
+
+    def __mul__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _new(self.real * a - self.imaginary * b, self.real * b + self.imaginary * a)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _divide(self.real, self.imaginary, a, b)
+
+    def __rtruediv__(self, other):
+        cdef double a, b
+        if not _parts(other, &a, &b):
+            return NotImplemented
+        return _divide(a, b, self.real, self.imaginary)
+
+    def __reduce__(self):
+        return CComplex, (self.real, self.imaginary)
+
+
+cdef inline CComplex _new(double real, double imaginary):
+    cdef CComplex number = CComplex.__new__(CComplex)
+    number.real = real
+    number.imaginary = imaginary
+    return number
+
+
+cdef inline bint _parts(object other, double *real, double *imaginary):
+    """Reads the real and imaginary parts of a CComplex, an int or a float. Returns False for any other type."""
+    if isinstance(other, CComplex):
+        real[0] = (<CComplex>other).real
+        imaginary[0] = (<CComplex>other).imaginary
+        return True
+    if isinstance(other, (int, float)):
+        real[0] = other
+        imaginary[0] = 0.0
+        return True
+    return False
+
+
+cdef CComplex _divide(double a, double b, double c, double d):
+    cdef double denominator = c * c + d * d
+    if denominator == 0:
+        raise ZeroDivisionError("complex division by zero")
+    return _new((a * c + b * d) / denominator, (b * c - a * d) / denominator)
@@ -0,0 +1,118 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled fast path for the parsing of complex number strings
+
+`parse` reads the most common forms, 'a', 'bi', 'a + bi' and 're^ti', in a single scan over the string's UTF-8
+buffer. The numbers are converted by the same C function as `float`, so the results are exactly the ones of
+`complex.complex._parse_complex_string`. Any other form, or anything unusual in the numbers (explicit '+' signs,
+'inf', underscores...), is left to that function. It is only available if the extension was compiled when installing
+the package.
+"""
+
+from cpython.ref cimport PyObject
+
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+    double PyOS_string_to_double(const char *s, char **endptr, PyObject *overflow_exception) except? -1.0
+
+
+cdef inline Py_ssize_t _skip_spaces(const char *buffer, Py_ssize_t position, Py_ssize_t end):
+    while position < end and buffer[position] == b" ":
+        position += 1
+    return position
+
+
+cdef inline bint _is_digit(char character):
+    return b"0" <= character <= b"9"
+
+
+cdef Py_ssize_t _number_end(const char *buffer, Py_ssize_t position, Py_ssize_t end):
+    """Returns the position right after the plain decimal number starting at *position*, or -1 if there is none"""
+    cdef Py_ssize_t digits = 0
+    if position < end and buffer[position] == b"-":
+        position += 1
+    while position < end and _is_digit(buffer[position]):
+        position += 1
+        digits += 1
+    if position < end and buffer[position] == b".":
+        position += 1
+        while position < end and _is_digit(buffer[position]):
+            position += 1
+            digits += 1
+    if digits == 0:
+        return -1
+    if position < end and (buffer[position] == b"e" or buffer[position] == b"E"):
+        if position + 1 < end and buffer[position + 1] == b"^":
+            # 'e^' of the exponential form, not an exponent
+            return position
+        position += 1
+        if position < end and buffer[position] == b"-":
+            position += 1
+        digits = 0
+        while position < end and _is_digit(buffer[position]):
+            position += 1
+            digits += 1
+        if digits == 0:
+            return -1
+    return position
+
+
+cdef bint _read_number(const char *buffer, Py_ssize_t *position, Py_ssize_t end, double *value) except -1:
+    """Reads the number starting at *position* into *value* and moves *position* after it. Returns False if there is
+    no plain decimal number there."""
+    cdef Py_ssize_t number_end = _number_end(buffer, position[0], end)
+    cdef char *parsed_end
+    if number_end < 0:
+        return False
+    value[0] = PyOS_string_to_double(buffer + position[0], &parsed_end, NULL)
+    if parsed_end != buffer + number_end:
+        return False
+    position[0] = number_end
+    return True
+
+
+def parse(str the_string):
+    """Parses *the_string* if it is in one of the forms 'a', 'bi', 'a + bi' or 're^ti'
+
+    Spaces around the numbers and a '*' before the 'i' are allowed.
+
+    Parameters
+    ----------
+    the_string: str
+
+    Returns
+    -------
+    Union[None, Tuple[Optional[float], Optional[float], Optional[float], Optional[float], bool]]
+        Same as `complex.complex._parse_complex_string`, or None if the string is in another form
+    """
+    cdef Py_ssize_t end
+    cdef const char *buffer = PyUnicode_AsUTF8AndSize(the_string, &end)
+    cdef Py_ssize_t position = _skip_spaces(buffer, 0, end)
+    cdef double first, second
+
+    if not _read_number(buffer, &position, end, &first):
+        return None
+    position = _skip_spaces(buffer, position, end)
+    if position == end:
+        return first, 0.0, None, None, True
+
+    if buffer[position] == b"+" or (buffer[position] == b"e" and position + 1 < end and buffer[position + 1] == b"^"):
+        cartesian = buffer[position] == b"+"
+        position = _skip_spaces(buffer, position + (1 if cartesian else 2), end)
+        if not _read_number(buffer, &position, end, &second):
+            return None
+        position = _skip_spaces(buffer, position, end)
+    else:
+        cartesian = None
+
+    if position < end and buffer[position] == b"*":
+        position = _skip_spaces(buffer, position + 1, end)
+    if position == end or buffer[position] != b"i":
+        return None
+    if _skip_spaces(buffer, position + 1, end) != end:
+        return None
+    if cartesian is None:
+        return 0.0, first, None, None, True
+    if cartesian:
+        return first, second, None, None, True
+    return None, None, first, second, False
@@ -0,0 +1,323 @@
+"""Vectorized exponential, logarithm and polar/cartesian conversions working on arrays of real and imaginary parts.
+
+The complex numbers are given as two float64 arrays, one for the real parts and one for the imaginary parts. If
+Numba is installed the kernels are compiled and run in parallel, otherwise NumPy is used. Setting the environment
+variable COMPLEX_USE_NUMBA to 0 forces the NumPy implementation, which avoids the compilation time on the first call.
+"""
+
+import math
+import os
+from typing import Sequence, Tuple
+
+import numpy as np
+
+_USE_NUMBA = os.environ.get("COMPLEX_USE_NUMBA", "1") != "0"
+
+njit = None
+if _USE_NUMBA:
+    try:
+        from numba import njit, prange
+    except ImportError:
+        pass
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _cexp_kernel(real, imaginary, out_real, out_imaginary):
+        for k in prange(real.shape[0]):
+            norm = math.exp(real[k])
+            out_real[k] = norm * math.cos(imaginary[k])
+            out_imaginary[k] = norm * math.sin(imaginary[k])
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _clog_kernel(real, imaginary, out_real, out_imaginary):
+        for k in prange(real.shape[0]):
+            out_real[k] = math.log(math.hypot(real[k], imaginary[k]))
+            out_imaginary[k] = math.atan2(imaginary[k], real[k])
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _polar_kernel(real, imaginary, out_norm, out_theta):
+        for k in prange(real.shape[0]):
+            out_norm[k] = math.hypot(real[k], imaginary[k])
+            out_theta[k] = math.atan2(imaginary[k], real[k])
+
+    @njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def _cartesian_kernel(norm, theta, out_real, out_imaginary):
+        for k in prange(norm.shape[0]):
+            out_real[k] = norm[k] * math.cos(theta[k])
+            out_imaginary[k] = norm[k] * math.sin(theta[k])
+
+else:
+
+    def _cexp_kernel(real, imaginary, out_real, out_imaginary):
+        norm = np.exp(real)
+        np.multiply(norm, np.cos(imaginary), out=out_real)
+        np.multiply(norm, np.sin(imaginary), out=out_imaginary)
+
+    def _clog_kernel(real, imaginary, out_real, out_imaginary):
+        np.log(np.hypot(real, imaginary), out=out_real)
+        np.arctan2(imaginary, real, out=out_imaginary)
+
+    def _polar_kernel(real, imaginary, out_norm, out_theta):
+        np.hypot(real, imaginary, out=out_norm)
+        np.arctan2(imaginary, real, out=out_theta)
+
+    def _cartesian_kernel(norm, theta, out_real, out_imaginary):
+        np.multiply(norm, np.cos(theta), out=out_real)
+        np.multiply(norm, np.sin(theta), out=out_imaginary)
+
+
+def _prepare(real, imaginary) -> Tuple[np.ndarray, np.ndarray]:
+    real = np.ascontiguousarray(real, dtype=np.float64)
+    imaginary = np.ascontiguousarray(imaginary, dtype=np.float64)
+    if real.shape != imaginary.shape:
+        raise ValueError(f"Real and imaginary parts must have the same shape, got {real.shape} and {imaginary.shape}")
+    return real, imaginary
+
+
+def cexp_array(real: np.ndarray, imaginary: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the exponential of many complex numbers at once
+
+    Parameters
+    ----------
+    real: np.ndarray
+        Real parts
+    imaginary: np.ndarray
+        Imaginary parts, same shape as *real*
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Real and imaginary parts of the exponentials
+
+    Examples
+    --------
+    >>> real, imaginary = cexp_array(np.array([0.0, 1.0]), np.array([0.0, 0.0]))
+    >>> print(real, imaginary)
+    [1.         2.71828183] [0. 0.]
+    """
+    real, imaginary = _prepare(real, imaginary)
+    out_real = np.empty_like(real)
+    out_imaginary = np.empty_like(imaginary)
+    _cexp_kernel(real.ravel(), imaginary.ravel(), out_real.ravel(), out_imaginary.ravel())
+    return out_real, out_imaginary
+
+
+def clog_array(real: np.ndarray, imaginary: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the natural logarithm of many complex numbers at once
+
+    Parameters
+    ----------
+    real: np.ndarray
+        Real parts
+    imaginary: np.ndarray
+        Imaginary parts, same shape as *real*
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Real and imaginary parts of the logarithms, the latter being the arguments of the numbers
+
+    Examples
+    --------
+    >>> real, imaginary = clog_array(np.array([1.0, 0.0]), np.array([0.0, 2.0]))
+    >>> print(real, imaginary)
+    [0.         0.69314718] [0.         1.57079633]
+    """
+    real, imaginary = _prepare(real, imaginary)
+    out_real = np.empty_like(real)
+    out_imaginary = np.empty_like(imaginary)
+    _clog_kernel(real.ravel(), imaginary.ravel(), out_real.ravel(), out_imaginary.ravel())
+    return out_real, out_imaginary
+
+
+def polar_array(real: np.ndarray, imaginary: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the norms and arguments of many complex numbers at once
+
+    Parameters
+    ----------
+    real: np.ndarray
+        Real parts
+    imaginary: np.ndarray
+        Imaginary parts, same shape as *real*
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Norms and arguments, the latter in ]-pi, pi]
+
+    Examples
+    --------
+    >>> norm, theta = polar_array(np.array([3.0, 0.0]), np.array([4.0, 2.0]))
+    >>> print(norm, theta)
+    [5. 2.] [0.92729522 1.57079633]
+    """
+    real, imaginary = _prepare(real, imaginary)
+    out_norm = np.empty_like(real)
+    out_theta = np.empty_like(imaginary)
+    _polar_kernel(real.ravel(), imaginary.ravel(), out_norm.ravel(), out_theta.ravel())
+    return out_norm, out_theta
+
+
+def cartesian_array(norm: np.ndarray, theta: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Computes the real and imaginary parts of many complex numbers at once from their norms and arguments
+
+    Parameters
+    ----------
+    norm: np.ndarray
+        Norms
+    theta: np.ndarray
+        Arguments, same shape as *norm*
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Real and imaginary parts
+
+    Examples
+    --------
+    >>> real, imaginary = cartesian_array(np.array([5.0, 2.0]), np.array([0.9272952180016123, 0.0]))
+    >>> print(real, imaginary)
+    [3. 2.] [4. 0.]
+    """
+    norm, theta = _prepare(norm, theta)
+    out_real = np.empty_like(norm)
+    out_imaginary = np.empty_like(theta)
+    _cartesian_kernel(norm.ravel(), theta.ravel(), out_real.ravel(), out_imaginary.ravel())
+    return out_real, out_imaginary
+
+
+_EXACT_POWERS_OF_TEN = np.array([10.0**k for k in range(23)])
+"""Powers of ten that are exactly representable as float64"""
+
+_MAX_EXACT_MANTISSA = 2**53
+"""Largest integer below which every integer is exactly representable as float64"""
+
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _skip_spaces(buffer, position, end):
+        while position < end and buffer[position] == 32:  # ' '
+            position += 1
+        return position
+
+    @njit(cache=True, boundscheck=False)
+    def _parse_number(buffer, position, end):
+        """Reads a decimal number starting at *position*. Returns the number, the position after it, and whether it
+        could be read exactly. Only numbers whose digits form an integer below 2**53, with a decimal exponent between
+        -22 and 22, are read exactly: the result is then a single correctly rounded operation on exact floats
+        (Clinger's fast path), so it equals what float() gives. Explicit '+' signs are not accepted, since
+        `complex.Complex`'s parser would take them for the separator of the real and imaginary parts."""
+        negative = False
+        if position < end and buffer[position] == 45:  # '-'
+            negative = True
+            position += 1
+        mantissa = 0
+        exponent = 0
+        digits = 0
+        exact = True
+        while position < end and 48 <= buffer[position] <= 57:  # '0' to '9'
+            mantissa = mantissa * 10 + (buffer[position] - 48)
+            digits += 1
+            if mantissa >= _MAX_EXACT_MANTISSA:
+                exact = False
+                mantissa = 0
+            position += 1
+        if position < end and buffer[position] == 46:  # '.'
+            position += 1
+            while position < end and 48 <= buffer[position] <= 57:
+                mantissa = mantissa * 10 + (buffer[position] - 48)
+                exponent -= 1
+                digits += 1
+                if mantissa >= _MAX_EXACT_MANTISSA:
+                    exact = False
+                    mantissa = 0
+                position += 1
+        if digits == 0:
+            return 0.0, position, False
+        if position < end and (buffer[position] == 101 or buffer[position] == 69):  # 'e' or 'E'
+            position += 1
+            negative_exponent = False
+            if position < end and buffer[position] == 45:
+                negative_exponent = True
+                position += 1
+            explicit = 0
+            exponent_digits = 0
+            while position < end and 48 <= buffer[position] <= 57:
+                if explicit < 10000:
+                    explicit = explicit * 10 + (buffer[position] - 48)
+                exponent_digits += 1
+                position += 1
+            if exponent_digits == 0:
+                return 0.0, position, False
+            exponent += -explicit if negative_exponent else explicit
+        if not exact or exponent < -22 or exponent > 22:
+            return 0.0, position, False
+        if exponent >= 0:
+            value = mantissa * _EXACT_POWERS_OF_TEN[exponent]
+        else:
+            value = mantissa / _EXACT_POWERS_OF_TEN[-exponent]
+        return (-value if negative else value), position, True
+
+    @njit(parallel=True, cache=True, boundscheck=False)
+    def _parse_cartesian_kernel(buffer, offsets, out_real, out_imaginary, out_parsed):
+        for k in prange(offsets.shape[0] - 1):
+            end = offsets[k + 1]
+            position = _skip_spaces(buffer, offsets[k], end)
+            real, position, parsed = _parse_number(buffer, position, end)
+            position = _skip_spaces(buffer, position, end)
+            if not parsed or position == end or buffer[position] != 43:  # '+'
+                out_parsed[k] = False
+                continue
+            position = _skip_spaces(buffer, position + 1, end)
+            imaginary, position, parsed = _parse_number(buffer, position, end)
+            position = _skip_spaces(buffer, position, end)
+            if position < end and buffer[position] == 42:  # '*'
+                position = _skip_spaces(buffer, position + 1, end)
+            if not parsed or position == end or buffer[position] != 105:  # 'i'
+                out_parsed[k] = False
+                continue
+            position = _skip_spaces(buffer, position + 1, end)
+            out_real[k] = real
+            out_imaginary[k] = imaginary
+            out_parsed[k] = position == end
+
+
+def parse_cartesian_strings(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parses many strings of the form 'a + bi' at once
+
+    The strings are packed into one byte buffer and read by a compiled kernel, in parallel. Only plain decimal numbers
+    that can be read exactly this way are parsed (up to 15 significant digits, roughly), so that the results are the
+    same as the ones of `complex.Complex`'s parser. The other strings are flagged and left for that parser. If Numba
+    is not available, no string is parsed.
+
+    Parameters
+    ----------
+    strings: Sequence[str]
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Real parts, imaginary parts, and a boolean array telling which strings were parsed. Real and imaginary parts
+        of the strings that were not parsed are undefined.
+
+    Examples
+    --------
+    >>> real, imaginary, parsed = parse_cartesian_strings(["3 + 4i", "1.5+-2e-3i"])
+    >>> print(real[parsed], imaginary[parsed])  # doctest: +SKIP
+    [3.  1.5] [ 4.    -0.002]
+    """
+    count = len(strings)
+    out_real = np.empty(count, dtype=np.float64)
+    out_imaginary = np.empty(count, dtype=np.float64)
+    out_parsed = np.zeros(count, dtype=np.bool_)
+    if njit is None or count == 0:
+        return out_real, out_imaginary, out_parsed
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum([len(string) for string in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    _parse_cartesian_kernel(buffer, offsets, out_real, out_imaginary, out_parsed)
+    return out_real, out_imaginary, out_parsed
@@ -0,0 +1,467 @@
+"""Contains the class ComplexArray, which holds many complex numbers as two arrays of real and imaginary parts"""
+
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from complex.complex import Complex, _parse_complex_string
+from complex._fast import cartesian_array, cexp_array, clog_array, parse_cartesian_strings, polar_array
+
+
+class ComplexArray:
+    """Array of complex numbers
+
+    The real and imaginary parts are stored in two separate float64 arrays rather than as a list of
+    `complex.Complex` objects, so that operations on the whole array run in NumPy's loops.
+
+    Attributes
+    ----------
+    real: np.ndarray
+    imaginary: np.ndarray
+    """
+
+    __slots__ = ("real", "imaginary")
+
+    def __init__(self, real: Union[np.ndarray, Iterable[float]], imaginary: Union[np.ndarray, Iterable[float]]):
+        """
+        Parameters
+        ----------
+        real: Union[np.ndarray, Iterable[float]]
+            Real parts
+        imaginary: Union[np.ndarray, Iterable[float]]
+            Imaginary parts, same shape as *real*
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, 1], [4, 2])
+        >>> print(zarray[0])
+        3.0 + 4.0i
+        >>> print(len(zarray))
+        2
+        """
+        self.real = np.asarray(real, dtype=np.float64)
+        self.imaginary = np.asarray(imaginary, dtype=np.float64)
+        if self.real.shape != self.imaginary.shape:
+            raise ValueError(
+                f"Real and imaginary parts must have the same shape, got {self.real.shape} and {self.imaginary.shape}"
+            )
+
+    @classmethod
+    def from_iterable(cls, numbers: Iterable[Complex]) -> "ComplexArray":
+        """Makes a ComplexArray from several `complex.Complex`
+
+        Parameters
+        ----------
+        numbers: Iterable[Complex]
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> zarray = ComplexArray.from_iterable([Complex(3, 4), Complex(1, 2)])
+        >>> print(zarray.real, zarray.imaginary)
+        [3. 1.] [4. 2.]
+        """
+        numbers = list(numbers)
+        real = np.fromiter((number.real for number in numbers), dtype=np.float64, count=len(numbers))
+        imaginary = np.fromiter((number.imaginary for number in numbers), dtype=np.float64, count=len(numbers))
+        return cls(real, imaginary)
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "ComplexArray":
+        """Makes a ComplexArray from strings, in any of the forms accepted by *Complex(from_string=...)*
+
+        Strings of the form 'a + bi' are first read all at once by `complex._fast.parse_cartesian_strings`. The others
+        are parsed one by one, by the same cached parser as `complex.Complex`, straight into the arrays: no
+        `complex.Complex` object is created. Numbers given in exponential or trigonometric form are converted to
+        cartesian form all at once, by `complex._fast.cartesian_array`.
+
+        Parameters
+        ----------
+        strings: Iterable[str]
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> zarray = ComplexArray.from_strings(["3 + 4i", "2i", "5e^0.9272952180016122i"])
+        >>> print(zarray.real, zarray.imaginary)
+        [3. 0. 3.] [4. 2. 4.]
+        """
+        strings = list(strings)
+        real, imaginary, done = parse_cartesian_strings(strings)
+        if done.all():
+            return cls(real, imaginary)
+        left = np.flatnonzero(~done)
+        parsed = [_parse_complex_string(strings[k]) for k in left]
+        count = len(parsed)
+        # (real, imaginary) for cartesian strings, (norm, theta) for the others
+        first = np.fromiter((p[0] if p[4] else p[2] for p in parsed), dtype=np.float64, count=count)
+        second = np.fromiter((p[1] if p[4] else p[3] for p in parsed), dtype=np.float64, count=count)
+        polar = np.fromiter((not p[4] for p in parsed), dtype=bool, count=count)
+        if polar.any():
+            first[polar], second[polar] = cartesian_array(first[polar], second[polar])
+        real[left], imaginary[left] = first, second
+        return cls(real, imaginary)
+
+    @classmethod
+    def from_polar(
+        cls, norm: Union[np.ndarray, Iterable[float]], theta: Union[np.ndarray, Iterable[float]]
+    ) -> "ComplexArray":
+        """Makes a ComplexArray from norms and arguments
+
+        Parameters
+        ----------
+        norm: Union[np.ndarray, Iterable[float]]
+        theta: Union[np.ndarray, Iterable[float]]
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> zarray = ComplexArray.from_polar([5], [0.9272952180016123])
+        >>> print(zarray.real, zarray.imaginary)
+        [3.] [4.]
+        """
+        norm = np.asarray(norm, dtype=np.float64)
+        theta = np.asarray(theta, dtype=np.float64)
+        if (norm < 0).any():
+            raise ValueError("A complex number's norm cannot be negative!")
+        return cls(*cartesian_array(norm, theta))
+
+    @classmethod
+    def from_complex128(cls, values: np.ndarray) -> "ComplexArray":
+        """Makes a ComplexArray from a NumPy complex128 array, without copying it
+
+        The real and imaginary parts of the ComplexArray are views on *values*, so modifying one modifies the other.
+
+        Parameters
+        ----------
+        values: np.ndarray
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> zarray = ComplexArray.from_complex128(np.array([3 + 4j, 1 + 2j]))
+        >>> print(zarray.real, zarray.imaginary)
+        [3. 1.] [4. 2.]
+        """
+        values = np.asarray(values, dtype=np.complex128)
+        return cls(values.real, values.imag)
+
+    def view_complex128(self) -> np.ndarray:
+        """Returns the numbers as a NumPy complex128 array, to use them with NumPy functions
+
+        If the real and imaginary parts are interleaved in the same buffer, which is the case when the ComplexArray was
+        made by `complex.array.ComplexArray.from_complex128`, the returned array is a view on that buffer. Otherwise, a
+        new array is allocated and filled.
+
+        Returns
+        -------
+        np.ndarray
+
+        Examples
+        --------
+        >>> values = np.array([3 + 4j, 1 + 2j])
+        >>> np.shares_memory(ComplexArray.from_complex128(values).view_complex128(), values)
+        True
+        >>> print(ComplexArray([3, 1], [4, 2]).view_complex128())
+        [3.+4.j 1.+2.j]
+        """
+        real, imaginary = self.real, self.imaginary
+        base = real.base
+        address = real.__array_interface__["data"][0]
+        if (
+            isinstance(base, np.ndarray)
+            and base.flags.c_contiguous
+            and imaginary.base is base
+            and real.shape == imaginary.shape
+            and real.strides == imaginary.strides
+            and imaginary.__array_interface__["data"][0] == address + 8
+        ):
+            # Real and imaginary parts are interleaved in the same buffer: reinterpret it as complex128
+            offset = address - base.__array_interface__["data"][0]
+            return np.ndarray(real.shape, dtype=np.complex128, buffer=base, offset=offset, strides=real.strides)
+        values = np.empty(self.real.shape, dtype=np.complex128)
+        values.real = self.real
+        values.imag = self.imaginary
+        return values
+
+    def to_list(self) -> List[Complex]:
+        """Returns the numbers as a list of `complex.Complex`, the opposite of
+        `complex.array.ComplexArray.from_iterable`
+
+        Returns
+        -------
+        List[Complex]
+
+        Examples
+        --------
+        >>> print(ComplexArray([3, 1], [4, 2]).to_list()[1])
+        1.0 + 2.0i
+        """
+        return [Complex._from_cartesian(a, b) for a, b in zip(self.real.tolist(), self.imaginary.tolist())]
+
+    def to_polar(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Norms and arguments of the numbers, computed together by `complex._fast.polar_array`
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+
+        Examples
+        --------
+        >>> norm, theta = ComplexArray([3, 0], [4, 2]).to_polar()
+        >>> print(norm)
+        [5. 2.]
+        """
+        return polar_array(self.real, self.imaginary)
+
+    @property
+    def norm(self) -> np.ndarray:
+        """Norms"""
+        return np.hypot(self.real, self.imaginary)
+
+    @property
+    def theta(self) -> np.ndarray:
+        """Arguments, in ]-pi, pi]"""
+        return np.arctan2(self.imaginary, self.real)
+
+    @property
+    def conjugate(self) -> "ComplexArray":
+        """Complex conjugates"""
+        return ComplexArray(self.real, -self.imaginary)
+
+    def __len__(self) -> int:
+        return len(self.real)
+
+    def __getitem__(self, item) -> Union[Complex, "ComplexArray"]:
+        real, imaginary = self.real[item], self.imaginary[item]
+        if np.ndim(real) == 0:
+            return Complex(real, imaginary)
+        return ComplexArray(real, imaginary)
+
+    def __repr__(self) -> str:
+        return f"ComplexArray({self.real!r}, {self.imaginary!r})"
+
+    def exp(self) -> "ComplexArray":
+        """Exponential of each number, using `complex._fast.cexp_array`
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> print(ComplexArray([1.0], [0.0]).exp().real)
+        [2.71828183]
+        """
+        return ComplexArray(*cexp_array(self.real, self.imaginary))
+
+    def log(self) -> "ComplexArray":
+        """Natural logarithm of each number, using `complex._fast.clog_array`
+
+        Returns
+        -------
+        ComplexArray
+
+        Examples
+        --------
+        >>> print(ComplexArray([0.0], [1.0]).log()[0])
+        0.0 + 1.5707963267948966i
+        """
+        return ComplexArray(*clog_array(self.real, self.imaginary))
+
+    @staticmethod
+    def _parts(other: Union["ComplexArray", Complex, float, complex, np.ndarray]) -> Optional[Tuple]:
+        """Returns the real and imaginary parts of an operand, or None if its type is not supported"""
+        if isinstance(other, (ComplexArray, Complex)):
+            return other.real, other.imaginary
+        if isinstance(other, (int, float, complex, np.number, np.ndarray)):
+            if np.iscomplexobj(other):
+                return np.real(other), np.imag(other)
+            return other, 0.0
+        return None
+
+    def __add__(self, other: Union["ComplexArray", Complex, float, np.ndarray]) -> "ComplexArray":
+        """
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, 1], [4, 2])
+        >>> print((zarray + zarray).real)
+        [6. 2.]
+        >>> print((zarray + Complex(1, 1)).imaginary)
+        [5. 3.]
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return ComplexArray(self.real + real, self.imaginary + imaginary)
+
+    def __sub__(self, other: Union["ComplexArray", Complex, float, np.ndarray]) -> "ComplexArray":
+        """
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, 1], [4, 2])
+        >>> print((zarray - Complex(1, 1)).imaginary)
+        [3. 1.]
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return ComplexArray(self.real - real, self.imaginary - imaginary)
+
+    def __rsub__(self, other: Union[Complex, float, np.ndarray]) -> "ComplexArray":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return ComplexArray(real - self.real, imaginary - self.imaginary)
+
+    def __mul__(self, other: Union["ComplexArray", Complex, float, np.ndarray]) -> "ComplexArray":
+        """
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, 1], [4, 2])
+        >>> product = zarray * zarray
+        >>> print(product.real, product.imaginary)
+        [-7. -3.] [24.  4.]
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return ComplexArray(
+            self.real * real - self.imaginary * imaginary, self.real * imaginary + self.imaginary * real
+        )
+
+    def __truediv__(self, other: Union["ComplexArray", Complex, float, np.ndarray]) -> "ComplexArray":
+        """
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([-5, 1], [10, 2])
+        >>> quotient = zarray / Complex(1, 2)
+        >>> print(quotient.real, quotient.imaginary)
+        [3. 1.] [4. 0.]
+        """
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return self._divide(self.real, self.imaginary, real, imaginary)
+
+    def __rtruediv__(self, other: Union[Complex, float, np.ndarray]) -> "ComplexArray":
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        real, imaginary = parts
+        return self._divide(real, imaginary, self.real, self.imaginary)
+
+    @staticmethod
+    def _divide(a, b, c, d) -> "ComplexArray":
+        denominator = c * c + d * d
+        return ComplexArray((a * c + b * d) / denominator, (b * c - a * d) / denominator)
+
+    def __pow__(self, other: Union[float, np.ndarray]) -> "ComplexArray":
+        """Raises every number to the real power *other*, or each number to its own power if *other* is an array
+
+        Squares and square roots are computed from the real and imaginary parts, other powers from the norms and
+        arguments, like `complex.Complex.__pow__`.
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, -7], [4, 24])
+        >>> print((zarray ** 2).real)
+        [  -7. -527.]
+        >>> print((zarray ** 0.5).imaginary)
+        [1. 4.]
+        """
+        if isinstance(other, (str, Complex, ComplexArray)):
+            return NotImplemented
+        # Array exponents, one per number, go through the general case
+        scalar = np.ndim(other) == 0
+        if scalar and other == 2:
+            return ComplexArray(self.real * self.real - self.imaginary * self.imaginary, 2 * self.real * self.imaginary)
+        if scalar and other == 0.5:
+            # Same formulas as complex.functions.sqrt_from_ab
+            root = np.sqrt((np.hypot(self.real, self.imaginary) + np.abs(self.real)) / 2)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                other_part = np.where(root == 0, 0.0, np.abs(self.imaginary) / (2 * root))
+            positive = self.real >= 0
+            return ComplexArray(
+                np.where(positive, root, other_part),
+                np.where(positive, np.copysign(other_part, self.imaginary), np.copysign(root, self.imaginary)),
+            )
+        norm, theta = polar_array(self.real, self.imaginary)
+        return ComplexArray(*cartesian_array(norm ** other, theta * other))
+
+    def __neg__(self) -> "ComplexArray":
+        return ComplexArray(-self.real, -self.imaginary)
+
+    def __abs__(self) -> np.ndarray:
+        return self.norm
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs, **kwargs):
+        """Makes NumPy arithmetic ufuncs use the ComplexArray's own operations
+
+        NumPy calls this when a ufunc gets a ComplexArray, for instance in *np.ones(2) + zarray*. Without it, NumPy
+        would iterate over the ComplexArray and apply the ufunc to each `complex.Complex` in Python. Only plain calls
+        of *np.add*, *np.subtract*, *np.multiply*, *np.true_divide*, *np.power*, *np.negative*, *np.absolute*,
+        *np.conjugate*, *np.exp*, *np.log* and *np.sqrt* are supported, without keyword arguments; NumPy raises
+        TypeError for the others.
+
+        Examples
+        --------
+        >>> zarray = ComplexArray([3, 1], [4, 2])
+        >>> print((np.array([1.0, 2.0]) + zarray).real)
+        [4. 3.]
+        >>> print(np.sqrt(ComplexArray([-7], [24]))[0])
+        3.0 + 4.0i
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if len(inputs) == 1:
+            if ufunc is np.conjugate:
+                return self.conjugate
+            if ufunc is np.sqrt:
+                return self ** 0.5
+            name = _UNARY_UFUNCS.get(ufunc)
+            return NotImplemented if name is None else getattr(self, name)()
+        name, reflected_name = _BINARY_UFUNCS.get(ufunc, (None, None))
+        if len(inputs) != 2 or name is None:
+            return NotImplemented
+        left, right = inputs
+        if left is self:
+            return getattr(self, name)(right)
+        if reflected_name is None:
+            return NotImplemented
+        return getattr(self, reflected_name)(left)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+
+# Methods of ComplexArray called by ComplexArray.__array_ufunc__ for each ufunc
+_UNARY_UFUNCS = {np.negative: "__neg__", np.absolute: "__abs__", np.exp: "exp", np.log: "log"}
+_BINARY_UFUNCS = {
+    np.add: ("__add__", "__radd__"),
+    np.subtract: ("__sub__", "__rsub__"),
+    np.multiply: ("__mul__", "__rmul__"),
+    np.true_divide: ("__truediv__", "__rtruediv__"),
+    np.power: ("__pow__", None),
+}
@@ -1,30 +1,102 @@
 """Contains the class Complex, which implements the notion of complex number"""
 
 
+import functools
 import math
-from typing import Union, Optional
-from plotly.graph_objs import Figure
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-
-from complex.functions import compatible_numbers, r_theta_from_ab, ab_from_r_theta
-
-
-class ForbiddenAssignmentError(Exception):
-    """Home-made class used to tell the user that Complex does not allow for new attributes assignment. I.e, one
-    can do 'some_complex_number.a = 0', but not 'some_complex_number.foo = 0', for 'foo' is not a known attribute of
-    the class."""
-
-
-PROTECTED_ATTRIBUTES = [
-    "_Complex__real",
-    "_Complex__imaginary",
-    "_Complex__norm",
-    "_Complex__theta",
-    "_Complex__cartesian",
-]
-ATTRIBUTES = ["real", "imaginary", "norm", "theta", "cartesian"]
+import re
+import sys
+from typing import TYPE_CHECKING, Union, Optional, Tuple
+import numpy as np
+
+from complex.functions import (
+    compatible_numbers,
+    r_theta_from_ab,
+    ab_from_r_theta,
+    square_from_ab,
+    power_from_ab,
+    sqrt_from_ab,
+)
+
+try:
+    from complex._cparse import parse as _compiled_parse
+except ImportError:
+    _compiled_parse = None
+
+if TYPE_CHECKING:
+    from plotly.graph_objs import Figure
+
+
+ForbiddenAssignmentError = AttributeError
+"""Complex does not allow for new attributes assignment. I.e, one can do 'some_complex_number.real = 0', but not
+'some_complex_number.foo = 0', for 'foo' is not a known attribute of the class. Since the attributes are stored in
+__slots__, Python raises AttributeError in that case, and ForbiddenAssignmentError is kept as an alias of it."""
+
+_FORMAT_RE = re.compile(r"(e\^|exp)|(cos|sin)", re.ASCII)
+"""Finds out in one pass whether a string is in exponential ('e^' or 'exp') or trigonometric ('cos' or 'sin') form,
+and where the separator is. If neither matches, the string is in cartesian form."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_complex_string(
+    the_string: str,
+) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float], bool]:
+    """Parses a string representing a complex number, see `complex.Complex.__init__` for the accepted formats.
+
+    Results are cached, since the same strings tend to be parsed over and over (constant operands in a loop, for
+    instance).
+
+    Returns
+    -------
+    Tuple[Optional[float], Optional[float], Optional[float], Optional[float], bool]
+        Real part, imaginary part, norm, argument, and whether the string was in cartesian form. Only the parts of
+        the form used in the string are given, the others are None.
+    """
+    if _compiled_parse is not None:
+        # Compiled single-pass reader for the most common forms, see complex._cparse
+        parsed = _compiled_parse(the_string)
+        if parsed is not None:
+            return parsed
+    # Pure real and pure imaginary numbers are read by float() directly. The cheap checks avoid paying for a raised
+    # ValueError on the usual cartesian, exponential and trigonometric forms.
+    if "+" not in the_string and "^" not in the_string and "(" not in the_string:
+        try:
+            if the_string.endswith("i"):
+                return 0.0, float(the_string[:-1]), None, None, True
+            return float(the_string), 0.0, None, None, True
+        except ValueError:
+            pass
+    # Chained str.replace is faster than a single str.translate or re.sub here: each call is a fast C search that
+    # returns the string itself when the character is absent
+    the_string = the_string.replace("(", "")
+    the_string = the_string.replace(")", "")
+    the_string = the_string.replace("*", "")
+    the_string = the_string.replace("x", "")
+    the_string = the_string.replace(" ", "")
+    # TODO (pcotte) Add possibility to write something like '3 x e^(i x pi / 4)'
+    match = _FORMAT_RE.search(the_string)
+    if match is not None:
+        left, right = the_string[: match.start()], the_string[match.end() :]
+        if match.group(2) is not None:
+            # Only the part in 'cos' (or in 'sin' if it comes first) is used
+            right = right.partition("+")[0]
+        return None, None, float(left.replace("i", "")), float(right.replace("i", "")), False
+    real, plus, imaginary = the_string.partition("+")
+    if not plus:
+        if "i" in the_string:
+            return 0.0, float(the_string.replace("i", "")), None, None, True
+        return float(the_string), 0.0, None, None, True
+    return float(real), float(imaginary.replace("i", "")), None, None, True
+
+
+def _is_array(other) -> bool:
+    """Returns True for NumPy arrays and `complex.array.ComplexArray`. Operators of `complex.Complex` return
+    NotImplemented for them, so that the array's reflected operator computes the result."""
+    if isinstance(other, np.ndarray):
+        return True
+    # complex.array imports this module, and is itself only imported when used: if it is not loaded yet, other can
+    # not be a ComplexArray
+    array_module = sys.modules.get("complex.array")
+    return array_module is not None and isinstance(other, array_module.ComplexArray)
 
 
 class Complex:
@@ -36,8 +108,31 @@ class Complex:
     imaginary: float
     norm: float
     theta: float
+
+    No other attribute can be assigned.
+
+    Examples
+    --------
+    >>> z = Complex(3, 4)
+    >>> z.norm
+    5.0
+    >>> z.q = 2
+    Traceback (most recent call last):
+    ...
+    AttributeError: 'Complex' object has no attribute 'q'
+    >>> z.real = 4
+    >>> z.norm
+    5.656854249492381
     """
 
+    __slots__ = (
+        "_Complex__real",
+        "_Complex__imaginary",
+        "_Complex__norm",
+        "_Complex__theta",
+        "_Complex__cartesian",
+    )
+
     def __init__(
         self,
         real: Optional[Union[float, "Complex"]] = None,
@@ -78,7 +173,7 @@ class Complex:
         >>> print(znumber.norm)
         5.0
         >>> print(znumber.theta)
-        0.9272952180016123
+        0.9272952180016122
 
         >>> znumber = Complex(3, 4, 5, 0.9)
         Traceback (most recent call last):
@@ -104,7 +199,7 @@ class Complex:
         >>> print(znumber.norm)
         5.0
         >>> print(znumber.theta)
-        0.9272952180016123
+        0.9272952180016122
 
         >>> znumber = Complex(from_string="3")
         >>> print(znumber.real)
@@ -166,7 +261,7 @@ class Complex:
         >>> print(znumber.norm)
         5.0
         >>> print(znumber.theta)
-        0.9272952180016123
+        0.9272952180016122
 
         >>> znumber = Complex(from_string="5e^0.9272952180016123i")
         >>> print(znumber.real)
@@ -230,16 +325,108 @@ class Complex:
     def __init(self, from_string: Union[None, str], from_complex: Union[None, "Complex"]):
 
         if from_complex:
-            self.real = from_complex.real
-            self.imaginary = from_complex.imaginary
-            self.norm = from_complex.norm
-            self.theta = from_complex.theta
-            self.__cartesian = from_complex.cartesian
+            # Plain copy of the slots: whichever form is not computed yet in from_complex will be computed when read
+            self.__real = from_complex.__real
+            self.__imaginary = from_complex.__imaginary
+            self.__norm = from_complex.__norm
+            self.__theta = from_complex.__theta
+            self.__cartesian = from_complex.__cartesian
         elif from_string:
             self._guess_repr_from_string(from_string)
         else:
             self._guess_repr()
 
+    @classmethod
+    def from_parts(cls, real: float, imaginary: float) -> "Complex":
+        """Makes a Complex from its real and imaginary parts
+
+        Same as *Complex(real, imaginary)*, but skips the checks `complex.Complex.__init__` needs to find out which
+        representation was given, so it is faster when making many numbers.
+
+        Parameters
+        ----------
+        real: float
+        imaginary: float
+
+        Returns
+        -------
+        Complex
+
+        Examples
+        --------
+        >>> print(Complex.from_parts(3, 4))
+        3.0 + 4.0i
+        """
+        return cls._from_cartesian(float(real), float(imaginary))
+
+    @classmethod
+    def _from_cartesian(cls, real: float, imaginary: float, cartesian: bool = True) -> "Complex":
+        """Makes a Complex from its real and imaginary parts without any check or conversion. The norm and the
+        argument are computed the first time they are read.
+
+        For internal use, when the parts are already known to be valid floats, like in arithmetic operators.
+        """
+        new = cls.__new__(cls)
+        new.__real = real
+        new.__imaginary = imaginary
+        new.__norm = None
+        new.__theta = None
+        new.__cartesian = cartesian
+        return new
+
+    @classmethod
+    def _from_polar(cls, norm: float, theta: float, cartesian: bool = False) -> "Complex":
+        """Same as `complex.Complex._from_cartesian` but from the norm and the argument. The real and imaginary parts
+        are computed the first time they are read."""
+        new = cls.__new__(cls)
+        new.__real = None
+        new.__imaginary = None
+        new.__norm = norm
+        new.__theta = theta
+        new.__cartesian = cartesian
+        return new
+
+    @classmethod
+    def _from_string(cls, the_string: str) -> "Complex":
+        """Same as *Complex(from_string=the_string)*, without going through `complex.Complex.__init__`"""
+        new = cls.__new__(cls)
+        new._guess_repr_from_string(the_string)
+        return new
+
+    @classmethod
+    def from_complex128(cls, value: Union[np.complex128, complex]) -> "Complex":
+        """Makes a Complex from a NumPy complex128 or a builtin complex
+
+        Parameters
+        ----------
+        value: Union[np.complex128, complex]
+
+        Returns
+        -------
+        Complex
+
+        Examples
+        --------
+        >>> print(Complex.from_complex128(np.complex128(3 + 4j)))
+        3.0 + 4.0i
+        """
+        value = complex(value)
+        return cls(value.real, value.imag)
+
+    def to_complex128(self) -> np.complex128:
+        """Converts the number into a NumPy complex128, to use it with NumPy functions
+
+        Returns
+        -------
+        np.complex128
+
+        Examples
+        --------
+        >>> print(Complex(3, 4).to_complex128())
+        (3+4j)
+        """
+        return np.complex128(complex(self.real, self.imaginary))
+
     @property
     def conjugate(self) -> "Complex":
         """Returns the complex conjugate of this complex number
@@ -250,9 +437,9 @@ class Complex:
         """
         if self.cartesian is True:
             # pylint: disable=invalid-unary-operand-type
-            return Complex(self.real, -self.imaginary)
+            return Complex._from_cartesian(self.real, -self.imaginary)
         # pylint: disable=invalid-unary-operand-type
-        return Complex(norm=self.norm, theta=-self.theta)
+        return Complex._from_polar(self.norm, -self.theta)
 
     def __str__(self) -> str:
         return self.to_string()
@@ -287,11 +474,13 @@ class Complex:
         ValueError
             If given 'repres' argument is not "cartesian", "trigo" nor "exp"
         """
-        bsign = "+" if self.imaginary > 0 else "-"
         if repres == "cartesian":
-            return f"{self.real} {bsign} {abs(self.imaginary)}i"
+            imaginary = self.imaginary
+            bsign = "+" if imaginary > 0 else "-"
+            return f"{self.real} {bsign} {abs(imaginary)}i"
         if repres == "trigo":
-            return f"{self.norm} * (cos({self.theta}) + isin({self.theta}))"
+            theta = self.theta
+            return f"{self.norm} * (cos({theta}) + isin({theta}))"
         if repres == "exp":
             return f"{self.norm}e^{self.theta}i"
         raise ValueError(f"Unknown representation {repres}. Possibilities are 'cartesian', 'trigo' or 'expo'")
@@ -323,11 +512,13 @@ class Complex:
         ValueError
             If given 'repres' argument is not "cartesian", "trigo" nor "exp"
         """
-        bsign = "+" if self.imaginary > 0 else "-"
         if repres == "cartesian":
-            return f"{self.real} {bsign} {abs(self.imaginary)} * i"
+            imaginary = self.imaginary
+            bsign = "+" if imaginary > 0 else "-"
+            return f"{self.real} {bsign} {abs(imaginary)} * i"
         if repres == "trigo":
-            return f"{self.norm} * (cos({self.theta}) + i * sin({self.theta}))"
+            theta = self.theta
+            return f"{self.norm} * (cos({theta}) + i * sin({theta}))"
         if repres == "exp":
             return f"{self.norm} * e ** ({self.theta} * i)"
         raise ValueError(f"Unknown representation {repres}. Possibilities are 'cartesian', 'trigo' or 'expo'")
@@ -362,7 +553,8 @@ class Complex:
         if repres == "cartesian":
             return f"${self.real} + {self.imaginary}i$"
         if repres == "trigo":
-            return f"${self.norm} \\times (\\cos({self.theta}) + i \\sin({self.theta}))$"
+            theta = self.theta
+            return f"${self.norm} \\times (\\cos({theta}) + i \\sin({theta}))$"
         if repres == "exp":
             return f"${self.norm} \\text{{e}}^{{{self.theta} i}}$"
         raise ValueError(f"Unknown representation {repres}. Possibilities are 'cartesian', 'trigo' or 'expo'")
@@ -388,8 +580,8 @@ class Complex:
 
         """
         if self.cartesian is True:
-            return Complex(round(self.real, rount_to), round(self.imaginary, rount_to))
-        return Complex(norm=round(self.norm, rount_to), theta=round(self.theta, rount_to))
+            return Complex._from_cartesian(round(self.real, rount_to), round(self.imaginary, rount_to))
+        return Complex._from_polar(round(self.norm, rount_to), round(self.theta, rount_to))
 
     def ceil(self) -> "Complex":
         """Use `math.ceil` method to create a new complex number
@@ -408,8 +600,8 @@ class Complex:
 
         """
         if self.cartesian is True:
-            return Complex(math.ceil(self.real), math.ceil(self.imaginary))
-        return Complex(norm=math.ceil(self.norm), theta=math.ceil(self.theta))
+            return Complex._from_cartesian(float(math.ceil(self.real)), float(math.ceil(self.imaginary)))
+        return Complex._from_polar(float(math.ceil(self.norm)), float(math.ceil(self.theta)))
 
     def floor(self) -> "Complex":
         """Use `math.floor` method to create a new complex number
@@ -428,8 +620,8 @@ class Complex:
 
         """
         if self.cartesian is True:
-            return Complex(math.floor(self.real), math.floor(self.imaginary))
-        return Complex(norm=math.floor(self.norm), theta=math.floor(self.theta))
+            return Complex._from_cartesian(float(math.floor(self.real)), float(math.floor(self.imaginary)))
+        return Complex._from_polar(float(math.floor(self.norm)), float(math.floor(self.theta)))
 
     def trunc(self) -> "Complex":
         """Use `math.trunc` method to create a new complex number
@@ -447,10 +639,10 @@ class Complex:
         5.0e^0.0i
         """
         if self.cartesian is True:
-            return Complex(math.trunc(self.real), math.trunc(self.imaginary))
-        return Complex(norm=math.trunc(self.norm), theta=math.trunc(self.theta))
+            return Complex._from_cartesian(float(math.trunc(self.real)), float(math.trunc(self.imaginary)))
+        return Complex._from_polar(float(math.trunc(self.norm)), float(math.trunc(self.theta)))
 
-    def plot(self, fig: Optional[Figure] = None, **kwargs) -> Figure:
+    def plot(self, fig: Optional["Figure"] = None, **kwargs) -> "Figure":
         """Plots the complex number and returns a `plotly.graph_objs.Figure` object
 
         Parameters
@@ -464,7 +656,16 @@ class Complex:
         Returns
         -------
         Figure
+
+        Notes
+        -----
+        Plotly and pandas are only imported when this method is first called, to keep `import complex` fast.
         """
+        # pylint: disable=import-outside-toplevel
+        import pandas as pd
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         if fig is None:
             fig = px.scatter(
                 pd.DataFrame(columns=["$\\mathbb{R}$", "$\\mathbb{C}$"], data=[[self.real, self.imaginary]]),
@@ -480,77 +681,86 @@ class Complex:
     def real(self) -> float:
         """Real part.
 
-        If modified, recomputes norm and argument by using `complex.Complex.r_theta_from_ab`
+        Computed from the norm and argument the first time it is read after they changed.
+        If modified, norm and argument are recomputed by using `complex.functions.r_theta_from_ab` the next time they
+        are read
         """
-        if str(self.__real) == "-0.0":
-            return 0.0
-        return self.__real
+        if self.__real is None:
+            self.__compute_cartesian()
+        value = self.__real
+        # -0.0 == 0.0, so this also turns negative zeros into 0.0
+        return 0.0 if value == 0.0 else value
 
     @real.setter
     def real(self, value) -> None:
+        if self.__imaginary is None:
+            self.__compute_cartesian()
         self.__real = value
-        if self.real is None or self.imaginary is None:
-            self.__norm = None
-            self.__theta = None
-        else:
-            self.__norm, self.__theta = r_theta_from_ab(self.real, self.imaginary)
+        self.__norm = None
+        self.__theta = None
 
     @property
     def imaginary(self) -> float:
         """Imaginary part.
 
-        If modified, recomputes norm and argument by using `complex.Complex.r_theta_from_ab`
+        Computed from the norm and argument the first time it is read after they changed.
+        If modified, norm and argument are recomputed by using `complex.functions.r_theta_from_ab` the next time they
+        are read
         """
-        if str(self.__imaginary) == "-0.0":
-            return 0.0
-        return self.__imaginary
+        if self.__imaginary is None:
+            self.__compute_cartesian()
+        value = self.__imaginary
+        return 0.0 if value == 0.0 else value
 
     @imaginary.setter
     def imaginary(self, value) -> None:
+        if self.__real is None:
+            self.__compute_cartesian()
         self.__imaginary = value
-        if self.real is None or self.imaginary is None:
-            self.__norm = None
-            self.__theta = None
-        else:
-            self.__norm, self.__theta = r_theta_from_ab(self.real, self.imaginary)
+        self.__norm = None
+        self.__theta = None
 
     @property
     def norm(self) -> float:
         """Norm.
 
-        If modified, recomputes real and imaginary parts by using `complex.Complex.ab_from_r_theta`
+        Computed from the real and imaginary parts the first time it is read after they changed.
+        If modified, real and imaginary parts are recomputed by using `complex.functions.ab_from_r_theta` the next
+        time they are read
         """
-        if str(self.__norm) == "-0.0":
-            return 0.0
-        return self.__norm
+        if self.__norm is None:
+            self.__compute_polar()
+        value = self.__norm
+        return 0.0 if value == 0.0 else value
 
     @norm.setter
     def norm(self, value) -> None:
+        if self.__theta is None:
+            self.__compute_polar()
         self.__norm = value
-        if self.norm is None or self.theta is None:
-            self.__real = None
-            self.__imaginary = None
-        else:
-            self.__real, self.__imaginary = ab_from_r_theta(self.norm, self.theta)
+        self.__real = None
+        self.__imaginary = None
 
     @property
     def theta(self) -> float:
         """Argument.
 
-        If modified, recomputes real and imaginary parts by using `complex.Complex.ab_from_r_theta`
+        Computed from the real and imaginary parts the first time it is read after they changed.
+        If modified, real and imaginary parts are recomputed by using `complex.functions.ab_from_r_theta` the next
+        time they are read
         """
-        if str(self.__theta) == "-0.0":
-            return 0.0
-        return self.__theta
+        if self.__theta is None:
+            self.__compute_polar()
+        value = self.__theta
+        return 0.0 if value == 0.0 else value
 
     @theta.setter
     def theta(self, value) -> None:
+        if self.__norm is None:
+            self.__compute_polar()
         self.__theta = value
-        if self.norm is None or self.theta is None:
-            self.__real = None
-            self.__imaginary = None
-        else:
-            self.__real, self.__imaginary = ab_from_r_theta(self.norm, self.theta)
+        self.__real = None
+        self.__imaginary = None
 
     @property
     def cartesian(self):
@@ -568,18 +778,30 @@ class Complex:
         >>> znumber2 = Complex(norm=5, theta=0.9272952180016123)
         >>> znumber == znumber2
         True
+        >>> znumber == 3
+        False
+        >>> Complex(3, 0) == 3
+        True
 
         """
-        if isinstance(other, str):
-            other = Complex(from_string=other)
-        if isinstance(other, Complex):
-            if self.real == other.real and self.imaginary == other.imaginary:
-                return True
-            if self.norm == other.norm and self.theta == other.theta:
-                return True
-        elif self.real == other:
+        if other is self:
             return True
-        return False
+        if type(other) is not Complex:
+            if isinstance(other, str):
+                other = Complex._from_string(other)
+            elif not isinstance(other, Complex):
+                return self.imaginary == 0 and bool(self.real == other)
+        # When neither number knows its polar form, computing it would not change the outcome. The converse does not
+        # hold: arguments differing by 2 pi, or any argument with a zero norm, give the same point.
+        if self.__norm is None and other.__norm is None:
+            return self.__real == other.__real and self.__imaginary == other.__imaginary
+        if self.real == other.real and self.imaginary == other.imaginary:
+            return True
+        return self.norm == other.norm and self.theta == other.theta
+
+    # Complex numbers can be modified, and __eq__ accepts strings and matches on either form, so no hash can agree
+    # with it: Complex is left unhashable
+    __hash__ = None
 
     def __ne__(self, other: Union[int, float, "Complex", str]) -> bool:
         """
@@ -623,7 +845,7 @@ class Complex:
 
         """
         # pylint: disable=invalid-unary-operand-type
-        return Complex(real=-self.real, imaginary=-self.imaginary)
+        return Complex._from_cartesian(-self.real, -self.imaginary)
 
     def __abs__(self) -> float:
         return self.norm
@@ -657,18 +879,27 @@ class Complex:
         >>> znumber2 = 5
         >>> print(znumber + znumber2)
         8.0 + 4.0i
+        >>> print(1 + znumber)
+        4.0 + 4.0i
 
         """
-        new = Complex(self)
-
-        if isinstance(other, str):
-            other = Complex(from_string=other)
-        if isinstance(other, Complex):
-            new.real = new.real + other.real
-            new.imaginary = new.imaginary + other.imaginary
-        else:
-            new.real = new.real + other
-        return new
+        real, imaginary = self.__real, self.__imaginary
+        if real is None:
+            real, imaginary = self.real, self.imaginary
+        if type(other) is not Complex:
+            # Plain numbers are checked before the isinstance calls below, they are the most common other operands
+            if type(other) is float or type(other) is int:
+                return Complex._from_cartesian(real + other, imaginary, self.__cartesian)
+            if isinstance(other, str):
+                other = Complex._from_string(other)
+            elif not isinstance(other, Complex):
+                if _is_array(other):
+                    return NotImplemented
+                return Complex._from_cartesian(real + other, imaginary, self.__cartesian)
+        other_real, other_imaginary = other.__real, other.__imaginary
+        if other_real is None:
+            other_real, other_imaginary = other.real, other.imaginary
+        return Complex._from_cartesian(real + other_real, imaginary + other_imaginary, self.__cartesian)
 
     def __sub__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
@@ -687,16 +918,22 @@ class Complex:
         -2.0 + 4.0i
 
         """
-        new = Complex(self)
-
-        if isinstance(other, str):
-            other = Complex(from_string=other)
-        if isinstance(other, Complex):
-            new.real = new.real - other.real
-            new.imaginary = new.imaginary - other.imaginary
-        else:
-            new.real = new.real - other
-        return new
+        real, imaginary = self.__real, self.__imaginary
+        if real is None:
+            real, imaginary = self.real, self.imaginary
+        if type(other) is not Complex:
+            if type(other) is float or type(other) is int:
+                return Complex._from_cartesian(real - other, imaginary, self.__cartesian)
+            if isinstance(other, str):
+                other = Complex._from_string(other)
+            elif not isinstance(other, Complex):
+                if _is_array(other):
+                    return NotImplemented
+                return Complex._from_cartesian(real - other, imaginary, self.__cartesian)
+        other_real, other_imaginary = other.__real, other.__imaginary
+        if other_real is None:
+            other_real, other_imaginary = other.real, other.imaginary
+        return Complex._from_cartesian(real - other_real, imaginary - other_imaginary, self.__cartesian)
 
     def __mul__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
@@ -713,18 +950,39 @@ class Complex:
         >>> znumber2 = 5
         >>> print((znumber * znumber2).to_string("exp"))
         15.0e^4.0i
+        >>> print(Complex(3, 4) * Complex(1, 2))
+        -5.0 + 10.0i
+        >>> print(2 * Complex(3, 4))
+        6.0 + 8.0i
 
+        The product is computed from the norms and arguments if they are known, and from the real and imaginary parts
+        otherwise, so that no conversion between the two forms is needed.
         """
-        new = Complex(self)
-
-        if isinstance(other, str):
-            other = Complex(from_string=other)
-        if isinstance(other, Complex):
-            new.norm = new.norm * other.norm
-            new.theta = new.theta + other.theta
-        else:
-            new.norm = new.norm * other
-        return new
+        if type(other) is not Complex:
+            # Plain numbers are checked before the isinstance calls below, they are the most common other operands
+            if (type(other) is float or type(other) is int) and self.__real is not None:
+                return Complex._from_cartesian(self.__real * other, self.__imaginary * other, self.__cartesian)
+            if isinstance(other, str):
+                other = Complex._from_string(other)
+            elif not isinstance(other, Complex):
+                if _is_array(other):
+                    return NotImplemented
+                if self.__real is None:
+                    if other >= 0:
+                        return Complex._from_polar(self.__norm * other, self.__theta, self.__cartesian)
+                    # A negative norm is not allowed, so go through the cartesian form
+                    self.__compute_cartesian()
+                return Complex._from_cartesian(self.__real * other, self.__imaginary * other, self.__cartesian)
+        if self.__norm is None or other.__norm is None:
+            if self.__real is not None and other.__real is not None:
+                real, imaginary = self.__real, self.__imaginary
+                other_real, other_imaginary = other.__real, other.__imaginary
+                return Complex._from_cartesian(
+                    real * other_real - imaginary * other_imaginary,
+                    real * other_imaginary + imaginary * other_real,
+                    self.__cartesian,
+                )
+        return Complex._from_polar(self.norm * other.norm, self.theta + other.theta, self.__cartesian)
 
     def __truediv__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
@@ -741,18 +999,37 @@ class Complex:
         >>> znumber2 = 5
         >>> print((znumber / znumber2).to_string("exp"))
         0.6e^4.0i
+        >>> print(Complex(-5, 10) / Complex(1, 2))
+        3.0 + 4.0i
 
+        Like for `complex.Complex.__mul__`, the form in which the quotient is computed depends on what is known
+        about the operands.
         """
-        new = Complex(self)
-
-        if isinstance(other, str):
-            other = Complex(from_string=other)
-        if isinstance(other, Complex):
-            new.norm = new.norm / other.norm
-            new.theta = new.theta - other.theta
-        else:
-            new.norm = new.norm / other
-        return new
+        if type(other) is not Complex:
+            if (type(other) is float or type(other) is int) and self.__real is not None:
+                return Complex._from_cartesian(self.__real / other, self.__imaginary / other, self.__cartesian)
+            if isinstance(other, str):
+                other = Complex._from_string(other)
+            elif not isinstance(other, Complex):
+                if _is_array(other):
+                    return NotImplemented
+                if self.__real is None:
+                    if other >= 0:
+                        return Complex._from_polar(self.__norm / other, self.__theta, self.__cartesian)
+                    # A negative norm is not allowed, so go through the cartesian form
+                    self.__compute_cartesian()
+                return Complex._from_cartesian(self.__real / other, self.__imaginary / other, self.__cartesian)
+        if self.__norm is None or other.__norm is None:
+            if self.__real is not None and other.__real is not None:
+                real, imaginary = self.__real, self.__imaginary
+                other_real, other_imaginary = other.__real, other.__imaginary
+                denominator = other_real * other_real + other_imaginary * other_imaginary
+                return Complex._from_cartesian(
+                    (real * other_real + imaginary * other_imaginary) / denominator,
+                    (imaginary * other_real - real * other_imaginary) / denominator,
+                    self.__cartesian,
+                )
+        return Complex._from_polar(self.norm / other.norm, self.theta - other.theta, self.__cartesian)
 
     def __pow__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
@@ -773,29 +1050,31 @@ class Complex:
         >>> znumber2 = 5
         >>> print((znumber ** znumber2).to_string("exp"))
         243.0e^20.0i
+        >>> print(Complex(3, 4) ** 2)
+        -7.0 + 24.0i
+        >>> print(Complex(-7, 24) ** 0.5)
+        3.0 + 4.0i
 
+        Numbers created from their real and imaginary parts are squared, square-rooted and raised to small positive
+        integer powers directly from their real and imaginary parts. Other cases use the norm and argument.
         """
-        new = Complex(self)
-
         if isinstance(other, (str, Complex)):
             return NotImplemented
-        new.norm = new.norm ** other
-        new.theta = new.theta * other
-        return new
+        if self.cartesian is True:
+            if other == 2:
+                return Complex._from_cartesian(*square_from_ab(self.real, self.imaginary))
+            if other == 0.5:
+                return Complex._from_cartesian(*sqrt_from_ab(self.real, self.imaginary))
+            if isinstance(other, int) and 0 <= other <= 10:
+                return Complex._from_cartesian(*power_from_ab(self.real, self.imaginary, other))
 
-    # Reflected arithmetic operators
+        return Complex._from_polar(self.norm ** other, self.theta * other, self.__cartesian)
 
-    def __radd__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(3, 4)
-        >>> print(1 + znumber)
-        4.0 + 4.0i
+    # Reflected arithmetic operators
 
-        """
-        return self + other
+    # Addition and multiplication commute, so the reflected operators are the normal ones
+    __radd__ = __add__
+    __rmul__ = __mul__
 
     def __rsub__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
@@ -809,18 +1088,6 @@ class Complex:
         """
         return self - other
 
-    def __rmul__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(3, 4)
-        >>> print(2 * znumber)
-        6.0 + 8.0i
-
-        """
-        return self * other
-
     def __rtruediv__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         """
 
@@ -829,189 +1096,101 @@ class Complex:
         >>> znumber = Complex(3, 4)
         >>> print(3 / znumber)
         0.36 - 0.48i
+        >>> print((3 / Complex(norm=2, theta=1)).to_string("exp"))
+        1.5e^-1.0i
 
         """
-        return self.conjugate * other / self.norm ** 2
+        if isinstance(other, str):
+            return Complex._from_string(other) / self
+        if self.__real is None:
+            if other >= 0:
+                # x / (r e^(i t)) = (x / r) e^(-i t), no need for the cartesian form
+                return Complex._from_polar(other / self.__norm, -self.__theta, self.__cartesian)
+            self.__compute_cartesian()
+        real, imaginary = self.__real, self.__imaginary
+        # Squared norm straight from the cartesian parts, without the square root of math.hypot
+        ratio = other / (real * real + imaginary * imaginary)
+        return Complex._from_cartesian(real * ratio, -imaginary * ratio, self.__cartesian)
 
     def __rpow__(self, other: Union[int, float, "Complex", str]) -> "Complex":
         return NotImplemented
 
     # Augmented assignment
+    # Not done in place: Complex instances are often shared (think of complex.ZERO used as an accumulator's initial
+    # value), so 'z += other' binds z to a new number, like for floats. Aliasing the normal operators saves the extra
+    # call a wrapper would cost.
 
-    def __iadd__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(3, 4)
-        >>> znumber += Complex(5, 6)
-        >>> print(znumber)
-        8.0 + 10.0i
-
-        """
-        return self + other
-
-    def __isub__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(3, 4)
-        >>> znumber -= Complex(5, 6)
-        >>> print(znumber)
-        -2.0 - 2.0i
-
-        """
-        return self - other
-
-    def __imul__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(norm=3, theta=4)
-        >>> znumber *= Complex(norm=5, theta=6)
-        >>> print(znumber.to_string("exp"))
-        15.0e^10.0i
-
-        """
-        return self * other
-
-    def __idiv__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(norm=3, theta=4)
-        >>> znumber /= Complex(norm=5, theta=6)
-        >>> print(znumber.to_string("exp"))
-        0.6e^-2.0i
-
-        """
-        return self / other
-
-    def __ipow__(self, other: Union[int, float, "Complex", str]) -> "Complex":
-        """
-
-        Examples
-        --------
-        >>> znumber = Complex(norm=3, theta=4)
-        >>> znumber **= Complex(norm=5, theta=6)
-        Traceback (most recent call last):
-        ...
-        TypeError: unsupported operand type(s) for ** or pow(): 'Complex' and 'Complex'
-        >>> znumber **= "5e^6i"
-        Traceback (most recent call last):
-        ...
-        TypeError: unsupported operand type(s) for ** or pow(): 'Complex' and 'str'
-        >>> znumber **= 5
-        >>> print(znumber.to_string("exp"))
-        243.0e^20.0i
-
-        """
-        return self ** other
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
+    __ipow__ = __pow__
 
     def __copy__(self) -> "Complex":
-        return Complex(from_complex=self)
+        new = Complex._from_cartesian(self.__real, self.__imaginary, self.__cartesian)
+        new.__norm = self.__norm
+        new.__theta = self.__theta
+        return new
 
-    def __setattr__(self, key, value):
-        """
+    def __deepcopy__(self, memo) -> "Complex":
+        # The slots only hold floats and a bool, so a shallow copy is already a deep one
+        return self.__copy__()
 
-        Examples
-        --------
-        >>> z = Complex(3, 4)
-        >>> z.norm
-        5.0
-        >>> z.q = 2
-        Traceback (most recent call last):
-        ...
-        complex.ForbiddenAssignmentError: The Complex class does not allow for new attributes assignment
-        >>> z.real = 4
-        >>> z.norm
-        5.656854249492381
-        >>> z.__norm = 4
-        Traceback (most recent call last):
-        ...
-        complex.ForbiddenAssignmentError: The Complex class does not allow for new attributes assignment
-        """
-        if key not in ATTRIBUTES and key not in PROTECTED_ATTRIBUTES:
-            raise ForbiddenAssignmentError("The Complex class does not allow for new attributes assignment")
-        super().__setattr__(key, value)
+    # Internal methods
 
-    __deepcopy__ = __copy__
+    def __compute_polar(self) -> None:
+        """Computes norm and argument from the real and imaginary parts, if both are known"""
+        if self.__real is not None and self.__imaginary is not None:
+            self.__norm, self.__theta = r_theta_from_ab(self.real, self.imaginary)
 
-    # Internal methods
+    def __compute_cartesian(self) -> None:
+        """Computes real and imaginary parts from the norm and argument, if both are known"""
+        if self.__norm is not None and self.__theta is not None:
+            self.__real, self.__imaginary = ab_from_r_theta(self.norm, self.theta)
 
     def _guess_repr(self) -> None:
         """From real part, imaginary part, norm and a argument, identifies which representation was used
         to create this complex number. If real and imaginary parts were specified, will find that it is cartesian
         and compute norm and argument. If norm and argument were given, will do the opposite. If something like
         real part and norm was given, or not enough information to create the number, will raise ValueError"""
-        self.__cartesian = False
-        trigo = False
-
-        if self.__real is not None and self.__imaginary is not None:
-            self.__cartesian = True
-        if self.__norm is not None and self.__theta is not None:
-            trigo = True
-        if not self.cartesian and not trigo:
+        # Only one representation given, which is by far the most common case: the other one is computed when read
+        if self.__norm is None and self.__theta is None:
+            if self.__real is not None and self.__imaginary is not None:
+                self.__cartesian = True
+                return
+        elif self.__real is None and self.__imaginary is None:
+            if self.__norm is not None and self.__theta is not None:
+                self.__cartesian = False
+                return
+
+        cartesian = self.__real is not None and self.__imaginary is not None
+        trigo = self.__norm is not None and self.__theta is not None
+        if not cartesian and not trigo:
             raise ValueError("Not enough information provided at Complex number creation.")
 
-        if self.cartesian:
-            if self.__real is None or self.__imaginary is None:
-                norm = None
-                theta = None
-            else:
-                norm, theta = r_theta_from_ab(self.__real, self.__imaginary)
-            if trigo:
-                # Do not set self.norm and self.theta if trigo representation was found, since they were already
-                # specified by the user. Just check that those values are compatible with the given a and b
-                if not compatible_numbers(norm, self.__norm) or not compatible_numbers(theta, self.__theta):
-                    raise ValueError(
-                        "You specified both cartesian and trigo representations but the values are not compatible"
-                    )
-            else:
-                self.real = self.__real
-                self.imaginary = self.__imaginary
-        # If trigo, then not cartesian too. Set a and b.
+        if cartesian and trigo:
+            # Keep both representations, since they were both specified by the user. Just check that they agree
+            norm, theta = r_theta_from_ab(self.__real, self.__imaginary)
+            if not (compatible_numbers(norm, self.__norm) and compatible_numbers(theta, self.__theta)):
+                raise ValueError(
+                    "You specified both cartesian and trigo representations but the values are not compatible"
+                )
+        elif cartesian:
+            # A norm or an argument given alone is ignored
+            self.__norm = None
+            self.__theta = None
         else:
-            self.norm = self.__norm
-            self.theta = self.__theta
+            self.__real = None
+            self.__imaginary = None
+        self.__cartesian = cartesian
 
     def _guess_repr_from_string(self, the_string) -> None:
-        """Same as `complex.Complex._guess_repr` but using a string as input"""
-        the_string = the_string.replace("(", "")
-        the_string = the_string.replace(")", "")
-        the_string = the_string.replace("*", "")
-        the_string = the_string.replace("x", "")
-        the_string = the_string.replace(" ", "")
-        # TODO (pcotte) Add possibility to write something like '3 x e^(i x pi / 4)'
-        self.__cartesian = False
-        if "e^" in the_string or "exp" in the_string:
-            the_string = the_string.replace("i", "")
-            if "e^" in the_string:
-                self.norm = float(the_string.split("e^")[0])
-                self.theta = float(the_string.split("e^")[1])
-            else:
-                self.norm = float(the_string.split("exp")[0])
-                self.theta = float(the_string.split("exp")[1])
-        elif "cos" in the_string or "sin" in the_string:
-            the_string_splitted = the_string.split("+")[0].replace("i", "")
-            if "cos" in the_string_splitted:
-                self.norm = float(the_string_splitted.split("cos")[0])
-                self.theta = float(the_string_splitted.split("cos")[1])
-            else:
-                self.norm = float(the_string_splitted.split("sn")[0])
-                self.theta = float(the_string_splitted.split("sn")[1])
-        else:
-            self.__cartesian = True
-            if "+" not in the_string:
-                if "i" in the_string:
-                    self.real = 0.0
-                    self.imaginary = float(the_string.replace("i", ""))
-                else:
-                    self.real = float(the_string)
-                    self.imaginary = 0.0
-            else:
-                self.real = float(the_string.split("+")[0].replace(" ", ""))
-                self.imaginary = float(the_string.split("+")[1].replace(" ", "").replace("i", ""))
+        """Same as `complex.Complex._guess_repr` but using a string as input. The string is parsed by
+        `complex.complex._parse_complex_string`."""
+        (
+            self.__real,
+            self.__imaginary,
+            self.__norm,
+            self.__theta,
+            self.__cartesian,
+        ) = _parse_complex_string(the_string)
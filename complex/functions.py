@@ -5,19 +5,18 @@ from typing import Tuple
 
 
 def compatible_numbers(n_1: float, n_2: float, threshold: float = 1e-8) -> bool:
-    """Returns True if both numbers are equal or almost the same"""
-    if n_1 == n_2:
-        return True
+    """Returns True if both numbers are equal or almost the same.
 
-    if abs((n_1 - n_2) / n_1) < threshold:
-        return True
-
-    return False
+    *threshold* is used both as a relative tolerance and as an absolute one, so that numbers close to zero, like an
+    argument of 1e-20 against 0, are compatible."""
+    return math.isclose(n_1, n_2, rel_tol=threshold, abs_tol=threshold)
 
 
 def r_theta_from_ab(real: float, imaginary: float) -> Tuple[float, float]:
     """Returns norm and argument of a complex number from the real and imaginary parts
 
+    The argument is in ]-pi, pi], like the one given by `cmath.phase`.
+
     Parameters
     ----------
     real: float
@@ -29,15 +28,10 @@ def r_theta_from_ab(real: float, imaginary: float) -> Tuple[float, float]:
         Norm and argument
     """
 
-    norm = math.sqrt(real ** 2 + imaginary ** 2)
-    if imaginary > 0:
-        theta = math.acos(real / norm)
-    else:
-        theta = -math.acos(real / norm)
-
-    if abs(theta) < 1e-15:
-        theta = 0.0
-    return norm, theta
+    norm = math.hypot(real, imaginary)
+    if norm == 0:
+        return 0.0, 0.0
+    return norm, math.atan2(imaginary, real)
 
 
 def ab_from_r_theta(norm: float, theta: float) -> Tuple[float, float]:
@@ -55,8 +49,78 @@ def ab_from_r_theta(norm: float, theta: float) -> Tuple[float, float]:
     """
     real = norm * math.cos(theta)
     imaginary = norm * math.sin(theta)
+    # cos(pi / 2) is 6e-17, not 0: parts that are zero up to rounding are given as 0
     if abs(real) < 1e-15:
         real = 0.0
     if abs(imaginary) < 1e-15:
         imaginary = 0.0
     return real, imaginary
+
+
+def square_from_ab(real: float, imaginary: float) -> Tuple[float, float]:
+    """Returns real and imaginary parts of the square of a complex number, without going through its norm and
+    argument
+
+    Parameters
+    ----------
+    real: float
+    imaginary: float
+
+    Returns
+    -------
+    Tuple[float, float]
+        real and imaginary parts
+    """
+    return real * real - imaginary * imaginary, 2 * real * imaginary
+
+
+def power_from_ab(real: float, imaginary: float, exponent: int) -> Tuple[float, float]:
+    """Returns real and imaginary parts of a complex number raised to a positive integer power, using repeated
+    multiplications
+
+    Parameters
+    ----------
+    real: float
+    imaginary: float
+    exponent: int
+
+    Returns
+    -------
+    Tuple[float, float]
+        real and imaginary parts
+    """
+    result_real, result_imaginary = 1.0, 0.0
+    for _ in range(exponent):
+        result_real, result_imaginary = (
+            result_real * real - result_imaginary * imaginary,
+            result_real * imaginary + result_imaginary * real,
+        )
+    return result_real, result_imaginary
+
+
+def sqrt_from_ab(real: float, imaginary: float) -> Tuple[float, float]:
+    """Returns real and imaginary parts of the principal square root of a complex number, without going through its
+    norm and argument.
+
+    Uses the formula from W. Kahan, which avoids cancellation when the real part is negative. Like
+    `complex.functions.r_theta_from_ab`, a negative real number is given an argument of pi, so its square root has a
+    positive imaginary part.
+
+    Parameters
+    ----------
+    real: float
+    imaginary: float
+
+    Returns
+    -------
+    Tuple[float, float]
+        real and imaginary parts
+    """
+    norm = math.hypot(real, imaginary)
+    if norm == 0:
+        return 0.0, 0.0
+    if real >= 0:
+        root = math.sqrt((norm + real) / 2)
+        return root, imaginary / (2 * root)
+    root = math.sqrt((norm - real) / 2)
+    return abs(imaginary) / (2 * root), math.copysign(root, imaginary)
@@ -1,16 +1,33 @@
 from pathlib import Path
 import versioneer
 
-from setuptools import setup
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 cmdclass = versioneer.get_cmdclass()
 sdist_class = cmdclass["sdist"]
 
 workdir = Path(__file__).parent
 
+# The compiled extensions are optional: without Cython, or if compilation fails, the pure Python package is installed
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension("complex._ccomplex", ["complex/_ccomplex.pyx"], optional=True),
+            Extension("complex._cparse", ["complex/_cparse.pyx"], optional=True),
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
 if __name__ == "__main__":
 
     setup(
         version=versioneer.get_version(),
         cmdclass=cmdclass,
+        ext_modules=ext_modules,
     )
@@ -1,7 +1,27 @@
 # pylint: disable=missing-docstring
+import copy
 import math
+import subprocess
+import sys
+import numpy as np
 import pytest
-from complex import Complex, i
+from complex import (
+    CComplex,
+    Complex,
+    ComplexArray,
+    I,
+    ONE,
+    ZERO,
+    i,
+    cexp,
+    clog,
+    cexp_array,
+    clog_array,
+    polar_array,
+    cartesian_array,
+)
+from complex._fast import parse_cartesian_strings
+from complex.complex import _compiled_parse
 
 
 # noinspection PyUnusedLocal
@@ -9,7 +29,9 @@ from complex import Complex, i
     "real, imaginary, expected_r, expected_theta",
     [
         (3, 4, 5.0, 0.927295),
-        (4, 5, 6.403124, 0.896055)
+        (4, 5, 6.403124, 0.896055),
+        (-2, 0, 2.0, 3.141593),
+        (0, -1, 1.0, -1.570796)
     ]
 )
 def test_init(fix1, real, imaginary, expected_r, expected_theta):
@@ -42,6 +64,17 @@ def test_init_r(fix1, norm, theta, expected_a, expected_b):
         assert round(znumber.imaginary, 6) == expected_b
 
 
+def test_init_both_representations():
+    znumber = Complex(3, 4, 5, math.atan2(4, 3))
+    assert znumber.real == 3
+    assert znumber.norm == 5
+    with pytest.raises(ValueError):
+        Complex(0, 0, 1, 0)
+    assert Complex(1, 0, 1, 1e-20).theta == 1e-20
+    with pytest.raises(ValueError):
+        Complex(3, 4, 5.1, math.atan2(4, 3))
+
+
 # noinspection PyUnusedLocal
 def test_i(fix1):
     print("\n\n\nTesting i...\n")
@@ -54,7 +87,7 @@ def test_i(fix1):
 def test_expi(fix1):
     print("\n\n\nTesting expi...\n")
     _ = fix1
-    number = 3 * math.exp(2 * i)
+    number = 3 * cexp(2 * i)
     assert number == Complex(norm=3, theta=2)
 
 
@@ -63,5 +96,314 @@ def test_logi(fix1):
     print("\n\n\nTesting logi...\n")
     _ = fix1
     number = Complex(norm=3, theta=2)
-    # noinspection PyTypeChecker
-    assert math.log(number) == Complex(real=math.log(3), imaginary=2)
+    assert clog(number) == Complex(real=math.log(3), imaginary=2)
+
+
+# noinspection PyUnusedLocal
+def test_exp_log_array(fix1):
+    print("\n\n\nTesting exp and log on arrays...\n")
+    _ = fix1
+    numbers = [Complex(3, 4), Complex(-1, 0.5), Complex(0.25, -2)]
+    real = np.array([z.real for z in numbers])
+    imaginary = np.array([z.imaginary for z in numbers])
+    exp_real, exp_imaginary = cexp_array(real, imaginary)
+    log_real, log_imaginary = clog_array(real, imaginary)
+    for k, number in enumerate(numbers):
+        expected_exp, expected_log = cexp(number), clog(number)
+        assert round(exp_real[k], 9) == round(expected_exp.real, 9)
+        assert round(exp_imaginary[k], 9) == round(expected_exp.imaginary, 9)
+        assert round(log_real[k], 9) == round(expected_log.real, 9)
+        assert round(log_imaginary[k], 9) == round(expected_log.imaginary, 9)
+
+
+# noinspection PyUnusedLocal
+def test_complex_array(fix1):
+    print("\n\n\nTesting ComplexArray...\n")
+    _ = fix1
+    numbers = [Complex(3, 4), Complex(-1, 0.5), Complex(0.25, -2)]
+    zarray = ComplexArray.from_iterable(numbers)
+    assert len(zarray) == 3
+    for k, (number, other) in enumerate(zip(numbers, reversed(numbers))):
+        assert zarray[k] == number
+        assert (zarray + zarray[::-1])[k] == number + other
+        product = (zarray * zarray[::-1])[k]
+        assert round(product.real, 9) == round((number * other).real, 9)
+        assert round(product.imaginary, 9) == round((number * other).imaginary, 9)
+        for expected, result in [
+            (number - other, (zarray - zarray[::-1])[k]),
+            (number / other, (zarray / zarray[::-1])[k]),
+            (1 / number, (1 / zarray)[k]),
+            (Complex(2, 0) - number, (2 - zarray)[k]),
+            (-number, (-zarray)[k]),
+            (number.conjugate, zarray.conjugate[k]),
+            (number ** 2, (zarray ** 2)[k]),
+            (number ** 0.5, (zarray ** 0.5)[k]),
+            (number ** 3, (zarray ** 3)[k]),
+        ]:
+            assert round(result.real, 9) == round(expected.real, 9)
+            assert round(result.imaginary, 9) == round(expected.imaginary, 9)
+        assert round(zarray.norm[k], 9) == round(number.norm, 9)
+        assert round(zarray.theta[k], 9) == round(number.theta, 9)
+    assert zarray.to_list() == numbers
+    values = np.array([2.0, -1.0, 0.5])
+    for expected, result in [
+        (zarray + values, np.add(values, zarray)),
+        (values - zarray, values - zarray),
+        (zarray * values, values * zarray),
+        (values / zarray, np.true_divide(values, zarray)),
+        (zarray ** 0.5, np.sqrt(zarray)),
+        (zarray.exp(), np.exp(zarray)),
+        (zarray.conjugate, np.conjugate(zarray)),
+    ]:
+        assert isinstance(result, ComplexArray)
+        assert np.allclose(result.real, expected.real) and np.allclose(result.imaginary, expected.imaginary)
+    number = Complex(1, 1)
+    for expected, result in [
+        (zarray + number, number + zarray),
+        (-(zarray - number), number - zarray),
+        (zarray * number, number * zarray),
+        (1 / (zarray / number), number / zarray),
+    ]:
+        assert isinstance(result, ComplexArray)
+        assert np.allclose(result.real, expected.real) and np.allclose(result.imaginary, expected.imaginary)
+    powers = zarray ** np.array([2.0, 3.0, 0.5])
+    for k, (number, exponent) in enumerate(zip(numbers, [2, 3, 0.5])):
+        assert round(powers[k].real, 9) == round((number ** exponent).real, 9)
+        assert round(powers[k].imaginary, 9) == round((number ** exponent).imaginary, 9)
+    for operand in [1 + 2j, np.array([1 + 2j, -1j, 2.0])]:
+        for expected, result in [
+            (zarray + ComplexArray(np.real(operand), np.imag(operand)), zarray + operand),
+            (zarray * ComplexArray(np.real(operand), np.imag(operand)), operand * zarray),
+        ]:
+            assert np.allclose(result.real, expected.real) and np.allclose(result.imaginary, expected.imaginary)
+    with pytest.raises(TypeError):
+        _ = zarray + "3 + 4i"
+    products = number * values
+    assert products.dtype == object and products[1] == -number
+    assert np.array_equal(np.absolute(zarray), zarray.norm)
+    with pytest.raises(TypeError):
+        np.sin(zarray)
+    strings = ["3 + 4i", "-1", "0.5i", "2e^1.5i", "3cos(4) + 4isin(1)"]
+    zarray = ComplexArray.from_strings(strings)
+    for k, string in enumerate(strings):
+        assert round(zarray.real[k], 9) == round(Complex(from_string=string).real, 9)
+        assert round(zarray.imaginary[k], 9) == round(Complex(from_string=string).imaginary, 9)
+
+
+# noinspection PyUnusedLocal
+def test_constants(fix1):
+    print("\n\n\nTesting constants...\n")
+    _ = fix1
+    number = Complex(3, 4)
+    assert ZERO.norm == 0
+    assert number + ZERO == number
+    assert number * ONE == number
+    assert I == i == Complex(0, 1)
+
+
+# noinspection PyUnusedLocal
+def test_slots(fix1):
+    print("\n\n\nTesting slots...\n")
+    _ = fix1
+    number = Complex(3, 4)
+    assert not hasattr(number, "__dict__")
+
+
+# noinspection PyUnusedLocal
+def test_complex128(fix1):
+    print("\n\n\nTesting complex128 conversions...\n")
+    _ = fix1
+    number = Complex(3, 4)
+    assert Complex.from_complex128(number.to_complex128()) == number
+    values = np.array([3 + 4j, -1 + 0.5j])
+    zarray = ComplexArray.from_complex128(values)
+    assert zarray[1] == Complex(-1, 0.5)
+    view = zarray.view_complex128()
+    assert np.shares_memory(view, values)
+    zarray.real[0] = 5
+    assert view[0] == 5 + 4j
+    assert (ComplexArray([3, -1], [4, 0.5]).view_complex128() == np.array([3 + 4j, -1 + 0.5j])).all()
+
+
+# noinspection PyUnusedLocal
+@pytest.mark.skipif(CComplex is None, reason="complex._ccomplex extension is not compiled")
+def test_ccomplex(fix1):
+    print("\n\n\nTesting CComplex...\n")
+    _ = fix1
+    for first, second in [((3, 4), (5, 6)), ((-1, 0.5), (0.25, -2))]:
+        number, other = Complex(*first), Complex(*second)
+        cnumber, cother = CComplex(*first), CComplex(*second)
+        for expected, result in [
+            (number + other, cnumber + cother),
+            (number - other, cnumber - cother),
+            (number * other, cnumber * cother),
+            (number / other, cnumber / cother),
+            (2 * number, 2 * cnumber),
+            (cexp(number), cnumber.exp()),
+            (clog(number), cnumber.log()),
+        ]:
+            assert round(result.real, 9) == round(expected.real, 9)
+            assert round(result.imaginary, 9) == round(expected.imaginary, 9)
+
+
+# noinspection PyUnusedLocal
+def test_exp_log_ndarray(fix1):
+    print("\n\n\nTesting exp and log on NumPy arrays...\n")
+    _ = fix1
+    values = np.array([3 + 4j, -1 + 0.5j])
+    assert np.allclose(cexp(values), np.exp(values))
+    assert np.allclose(clog(values), np.log(values))
+    assert np.allclose(clog(values, 10), np.log10(values))
+    assert np.allclose(cexp(values.real), np.exp(values.real))
+    assert np.allclose(clog(np.array([1.0, 100.0]), 10), [0.0, 2.0])
+
+
+# noinspection PyUnusedLocal
+def test_operators_keep_representation(fix1):
+    print("\n\n\nTesting representation of operator results...\n")
+    _ = fix1
+    number, polar = Complex(3, 4), Complex(norm=5, theta=0.9272952180016123)
+    assert (number + 1).cartesian is True
+    assert (number * polar).cartesian is True
+    assert (polar - number).cartesian is False
+    assert (polar / 2).cartesian is False
+    assert (-polar).cartesian is True
+    assert number - number == ZERO
+    copied = copy.copy(number)
+    assert copied is not number
+    assert (copied.real, copied.imaginary, copied.cartesian) == (3.0, 4.0, True)
+    deep_copied = copy.deepcopy(polar)
+    assert deep_copied is not polar
+    assert (deep_copied.norm, deep_copied.theta, deep_copied.cartesian) == (polar.norm, polar.theta, False)
+    # Results must not depend on which form happens to be computed already
+    assert abs(number * -1) == 5.0
+    _ = number.norm
+    assert abs(number * -1) == 5.0
+    assert (number / -1).norm == 5.0
+    assert (polar * -1).norm == 5.0
+    assert (polar / -2).norm == 2.5
+
+
+# noinspection PyUnusedLocal
+def test_string_operands(fix1):
+    print("\n\n\nTesting string operands...\n")
+    _ = fix1
+    number = Complex(3, 4)
+    for _ in range(3):
+        assert number + "1 + 2i" == Complex(4, 6)
+        assert number * "2e^0i" == Complex(6, 8)
+    for string, expected in [("2.5", Complex(2.5, 0)), ("-1e-3i", Complex(0, -0.001)), (" 3 i", Complex(0, 3))]:
+        assert Complex(from_string=string) == expected
+    first, second = Complex(from_string="3 + 4i"), Complex(from_string="3 + 4i")
+    first.real = 0
+    assert (second.real, second.imaginary) == (3.0, 4.0)
+
+
+# noinspection PyUnusedLocal
+def test_polar_cartesian_array(fix1):
+    print("\n\n\nTesting polar_array and cartesian_array...\n")
+    _ = fix1
+    numbers = [Complex(3, 4), Complex(-1, 0.5), Complex(0.25, -2)]
+    zarray = ComplexArray.from_iterable(numbers)
+    norm, theta = polar_array(zarray.real, zarray.imaginary)
+    for k, number in enumerate(numbers):
+        assert round(norm[k], 9) == round(number.norm, 9)
+        assert round(theta[k], 9) == round(number.theta, 9)
+    real, imaginary = cartesian_array(norm, theta)
+    assert np.allclose(real, zarray.real)
+    assert np.allclose(imaginary, zarray.imaginary)
+
+
+# noinspection PyUnusedLocal
+def test_augmented_assignment(fix1):
+    print("\n\n\nTesting augmented assignment...\n")
+    _ = fix1
+    total = ZERO
+    for number in [Complex(3, 4), Complex(5, 6), "1 + 1i"]:
+        total += number
+    assert total == Complex(9, 11)
+    assert (ZERO.real, ZERO.imaginary) == (0.0, 0.0)
+    number = Complex(norm=3, theta=4)
+    number *= Complex(norm=5, theta=6)
+    assert (number.norm, number.theta) == (15.0, 10.0)
+    number /= 5
+    assert number.norm == 3.0
+    number **= 2
+    assert (number.norm, number.theta) == (9.0, 20.0)
+    number -= number
+    assert number == ZERO
+    with pytest.raises(TypeError):
+        number **= Complex(1, 1)
+
+
+# noinspection PyUnusedLocal
+def test_eq(fix1):
+    print("\n\n\nTesting equality...\n")
+    _ = fix1
+    assert Complex(3, 4) == Complex(3, 4)
+    assert Complex(3, 4) != Complex(3, 5)
+    assert Complex(norm=2, theta=1) == Complex(norm=2, theta=1)
+    assert Complex(3, 4) == Complex(norm=5, theta=0.9272952180016122)
+    assert Complex(3, 4) == "3 + 4i"
+    assert Complex(3, 4) != 3
+    assert Complex(3, 0) == 3
+    assert Complex(-0.0, 0) == ZERO
+    assert Complex(norm=1, theta=0) == Complex(norm=1, theta=2 * math.pi)
+    assert Complex(norm=0, theta=1) == Complex(norm=0, theta=2)
+    assert cexp(2 * math.pi * i) == cexp(0 * i)
+    assert cexp(math.pi * i) == cexp(-math.pi * i)
+    number = Complex(3, 4)
+    assert number == number
+    with pytest.raises(TypeError):
+        hash(number)
+
+
+# noinspection PyUnusedLocal
+def test_parse_cartesian_strings(fix1):
+    print("\n\n\nTesting parse_cartesian_strings...\n")
+    _ = fix1
+    strings = ["3 + 4i", "1.5+-2e-3i", "0.1 + 0.2 * i", "-0+0i", "1e23+1i", "3+4", "(3+4i)", "2e^1i"]
+    real, imaginary, parsed = parse_cartesian_strings(strings)
+    for k, string in enumerate(strings):
+        if parsed[k]:
+            expected = Complex(from_string=string)
+            assert (real[k], imaginary[k]) == (expected.real, expected.imaginary)
+    assert not parsed[4:].any()
+    zarray = ComplexArray.from_strings(strings)
+    assert zarray[6] == Complex(3, 4)
+    assert zarray[4].real == 1e23
+
+
+# noinspection PyUnusedLocal
+@pytest.mark.skipif(_compiled_parse is None, reason="complex._cparse extension is not compiled")
+def test_compiled_parse(fix1):
+    print("\n\n\nTesting complex._cparse...\n")
+    _ = fix1
+    assert _compiled_parse("3 + 4 * i") == (3.0, 4.0, None, None, True)
+    assert _compiled_parse(" -2.5 ") == (-2.5, 0.0, None, None, True)
+    assert _compiled_parse("1e-3i") == (0.0, 0.001, None, None, True)
+    assert _compiled_parse("5e^-0.5i") == (None, None, 5.0, -0.5, False)
+    for string in ["3cos(4) + 4isin(1)", "(3+4i)", "+3+4i", "3+4", "inf", "3 + 4ii", "5e^(1i)"]:
+        assert _compiled_parse(string) is None
+
+
+# noinspection PyUnusedLocal
+def test_from_parts(fix1):
+    print("\n\n\nTesting Complex.from_parts...\n")
+    _ = fix1
+    number = Complex.from_parts(3, 4)
+    assert number == Complex(3, 4)
+    assert number.cartesian
+    assert isinstance(number.real, float)
+    assert number.norm == 5
+
+
+# noinspection PyUnusedLocal
+def test_lazy_array_import(fix1):
+    print("\n\n\nTesting that scalar use does not import the array code...\n")
+    _ = fix1
+    code = (
+        "import sys; from complex import Complex, cexp; cexp(Complex(1, 2)) * 2 + 1; "
+        "assert 'complex._fast' not in sys.modules and 'complex.array' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)